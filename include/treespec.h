@@ -71,6 +71,14 @@ class PyTreeSpec {
                      const bool &none_is_leaf,
                      const std::string &registry_namespace);
 
+    // Flattens a PyTree into a list of leaves only. This is equivalent to `Flatten(...).first` but
+    // does not build the PyTreeSpec (no node data, entries, or traversal nodes are recorded).
+    static std::vector<py::object> FlattenLeaves(
+        const py::handle &tree,
+        const std::optional<py::function> &leaf_predicate = std::nullopt,
+        const bool &none_is_leaf = false,
+        const std::string &registry_namespace = "");
+
     // Flattens a PyTree into a list of leaves with a list of paths and a PyTreeSpec.
     // Returns references to the flattened objects, which might be temporary objects in the case of
     // custom PyType handlers.
@@ -264,6 +272,13 @@ class PyTreeSpec {
                          const std::optional<py::function> &leaf_predicate,
                          const std::string &registry_namespace);
 
+    template <bool NoneIsLeaf>
+    static void FlattenLeavesImpl(const py::handle &handle,
+                                  std::vector<py::object> &leaves,  // NOLINT[runtime/references]
+                                  const ssize_t &depth,
+                                  const std::optional<py::function> &leaf_predicate,
+                                  const std::string &registry_namespace);
+
     template <bool NoneIsLeaf, typename Span, typename Stack>
     bool FlattenIntoWithPathImpl(const py::handle &handle,
                                  Span &leaves,  // NOLINT[runtime/references]
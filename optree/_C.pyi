@@ -32,6 +32,12 @@ def flatten(
     node_is_leaf: bool = False,
     namespace: str = '',
 ) -> builtins.tuple[list[T], PyTreeSpec]: ...
+def flatten_leaves(
+    tree: PyTree[T],
+    leaf_predicate: Callable[[T], bool] | None = None,
+    node_is_leaf: bool = False,
+    namespace: str = '',
+) -> list[T]: ...
 def flatten_with_path(
     tree: PyTree[T],
     leaf_predicate: Callable[[T], bool] | None = None,
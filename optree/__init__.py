@@ -51,6 +51,7 @@ from optree.registry import (
     register_keypaths,
     register_pytree_node,
     register_pytree_node_class,
+    register_pytree_nodes,
 )
 from optree.typing import (
     CustomTreeNode,
@@ -100,6 +101,7 @@ __all__ = [
     'treespec_tuple',
     # Registry
     'register_pytree_node',
+    'register_pytree_nodes',
     'register_pytree_node_class',
     'Partial',
     'register_keypaths',
@@ -268,7 +268,7 @@ def tree_leaves(
     Returns:
         A list of leaf values.
     """
-    return _C.flatten(tree, is_leaf, none_is_leaf, namespace)[0]
+    return _C.flatten_leaves(tree, is_leaf, none_is_leaf, namespace)
 
 
 def tree_structure(
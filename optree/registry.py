@@ -18,18 +18,20 @@ from __future__ import annotations
 
 import functools
 import inspect
+import sys
 from collections import OrderedDict, defaultdict, deque
 from operator import methodcaller
 from threading import Lock
 from typing import Any, Callable, Iterable, NamedTuple, Sequence, overload
+from weakref import WeakKeyDictionary
 
 import optree._C as _C
 from optree.typing import KT, VT, CustomTreeNode, FlattenFunc, PyTree, T, UnflattenFunc
-from optree.utils import safe_zip, unzip2
 
 
 __all__ = [
     'register_pytree_node',
+    'register_pytree_nodes',
     'register_pytree_node_class',
     'Partial',
     'register_keypaths',
@@ -45,6 +47,7 @@ class PyTreeNodeRegistryEntry(NamedTuple):
 
 __GLOBAL_NAMESPACE: str = object()  # type: ignore[assignment]
 __REGISTRY_LOCK: Lock = Lock()
+__REGISTERED_NAMESPACES: set[str] = set()  # non-global namespaces with at least one entry
 
 
 def register_pytree_node(
@@ -160,6 +163,73 @@ def register_pytree_node(
             )
         )
     """
+    namespace, registration_key = _normalize_registration(cls, namespace)
+
+    # Only the C++ registration needs to be serialized. It raises on duplicate registrations, so the
+    # Python-side entry is published (with a single atomic `dict.__setitem__`) only on success.
+    # Lookups via `register_pytree_node.get` are lock-free.
+    with __REGISTRY_LOCK:
+        _C.register_node(cls, flatten_func, unflatten_func, namespace)
+    CustomTreeNode.register(cls)  # pylint: disable=no-member
+    _nodetype_registry[registration_key] = PyTreeNodeRegistryEntry(flatten_func, unflatten_func)
+    if namespace:
+        __REGISTERED_NAMESPACES.add(namespace)
+    return cls
+
+
+def register_pytree_nodes(
+    entries: Iterable[tuple[type[CustomTreeNode[T]], FlattenFunc, UnflattenFunc, str]]
+) -> None:
+    """Register multiple types as internal nodes in pytrees at once.
+
+    This is equivalent to calling :func:`register_pytree_node` for each entry, but all entries are
+    validated before any of them is registered, and the registry is locked and updated only once.
+    This is useful for libraries that register many types at import time.
+
+    If the registration of an entry fails (e.g., the type is already registered in the namespace),
+    the preceding entries remain registered and the error is re-raised.
+
+    Args:
+        entries (iterable of tuple): An iterable of ``(cls, flatten_func, unflatten_func, namespace)``
+            tuples. See :func:`register_pytree_node` for the meaning of each item.
+
+    Example::
+
+        >>> from optree import tree_flatten
+        >>> flatten_set = lambda s: (sorted(s), None, None)
+        >>> register_pytree_nodes(
+        ...     [
+        ...         (set, flatten_set, lambda _, children: set(children), 'sorted-set'),
+        ...         (frozenset, flatten_set, lambda _, children: frozenset(children), 'sorted-set'),
+        ...     ]
+        ... )
+        >>> tree_flatten({'a': {2, 1}, 'b': frozenset({3})}, namespace='sorted-set')  # doctest: +ELLIPSIS
+        ([1, 2, 3], PyTreeSpec(...))
+    """
+    registrations = []
+    for cls, flatten_func, unflatten_func, namespace in entries:
+        namespace, registration_key = _normalize_registration(cls, namespace)
+        entry = PyTreeNodeRegistryEntry(flatten_func, unflatten_func)
+        registrations.append((cls, namespace, registration_key, entry))
+
+    num_registered = 0
+    try:
+        with __REGISTRY_LOCK:
+            for cls, namespace, _, entry in registrations:
+                _C.register_node(cls, entry.to_iterable, entry.from_iterable, namespace)
+                num_registered += 1
+    finally:
+        registered = registrations[:num_registered]
+        for cls, *_ in registered:
+            CustomTreeNode.register(cls)  # pylint: disable=no-member
+        _nodetype_registry.update((key, entry) for _, _, key, entry in registered)
+        __REGISTERED_NAMESPACES.update(namespace for _, namespace, _, _ in registered if namespace)
+
+
+def _normalize_registration(
+    cls: type[CustomTreeNode[T]],
+    namespace: str,
+) -> tuple[str, type | tuple[str, type]]:
     if not inspect.isclass(cls):
         raise TypeError(f'Expected a class, got {cls}.')
     if namespace is not __GLOBAL_NAMESPACE and not isinstance(namespace, str):
@@ -167,18 +237,12 @@ def register_pytree_node(
     if namespace == '':
         raise ValueError('The namespace cannot be an empty string.')
 
-    registration_key: type | tuple[str, type]
     if namespace is __GLOBAL_NAMESPACE:
-        registration_key = cls
-        namespace = ''
-    else:
-        registration_key = (namespace, cls)
-
-    with __REGISTRY_LOCK:
-        _C.register_node(cls, flatten_func, unflatten_func, namespace)
-        CustomTreeNode.register(cls)  # pylint: disable=no-member
-        _nodetype_registry[registration_key] = PyTreeNodeRegistryEntry(flatten_func, unflatten_func)
-    return cls
+        return '', cls
+    # Intern the namespace so that lookups with the same (interned) string in the registry dict and
+    # the namespace set compare by identity
+    namespace = sys.intern(str(namespace))
+    return namespace, (namespace, cls)
 
 
 @overload
@@ -258,11 +322,8 @@ def register_pytree_node_class(
     if cls is __GLOBAL_NAMESPACE or isinstance(cls, str):
         if namespace is not None:
             raise ValueError('Cannot specify `namespace` when the first argument is a string.')
-        if cls == '':
-            raise ValueError('The namespace cannot be an empty string.')
-        return functools.partial(register_pytree_node_class, namespace=cls)  # type: ignore[return-value]
-
-    if namespace is None:
+        cls, namespace = None, cls
+    elif namespace is None:
         raise ValueError('Must specify `namespace` when the first argument is a class.')
     if namespace is not __GLOBAL_NAMESPACE and not isinstance(namespace, str):
         raise TypeError(f'The namespace must be a string, got {namespace}')
@@ -270,31 +331,46 @@ def register_pytree_node_class(
         raise ValueError('The namespace cannot be an empty string.')
 
     if cls is None:
-        return functools.partial(register_pytree_node_class, namespace=namespace)  # type: ignore[return-value]
+        # The namespace is validated once here rather than on each decorated class
+        def decorator(cls: type[CustomTreeNode[T]]) -> type[CustomTreeNode[T]]:
+            return _register_pytree_node_class(cls, namespace)
+
+        return decorator
+    return _register_pytree_node_class(cls, namespace)
+
+
+def _register_pytree_node_class(
+    cls: type[CustomTreeNode[T]],
+    namespace: str,
+) -> type[CustomTreeNode[T]]:
     if not inspect.isclass(cls):
         raise TypeError(f'Expected a class, got {cls}.')
-    register_pytree_node(cls, methodcaller('tree_flatten'), cls.tree_unflatten, namespace)
+    flatten_func: FlattenFunc
+    if inspect.isfunction(inspect.getattr_static(cls, 'tree_flatten', None)):
+        # A plain function defined on the class takes the instance as its first argument
+        flatten_func = cls.tree_flatten  # type: ignore[assignment]
+    else:
+        flatten_func = methodcaller('tree_flatten')
+    register_pytree_node(cls, flatten_func, cls.tree_unflatten, namespace)
     return cls
 
 
-def _sorted_items(items: Iterable[tuple[KT, VT]]) -> Iterable[tuple[KT, VT]]:  # pragma: no cover
+_TYPE_QUALNAME_CACHE: WeakKeyDictionary[type, str] = WeakKeyDictionary()
+
+
+def _type_qualname_sort_key(obj: Any) -> tuple[str, Any]:
+    # Compute `{obj.__class__.__module__}.{obj.__class__.__qualname__}` once per distinct key type
+    cls = obj.__class__
     try:
-        # Sort directly if possible (do not use `key` for performance reasons)
-        return sorted(items)
-    except TypeError:  # the keys are not comparable
-        try:
-            # Add `{obj.__class__.__module__}.{obj.__class__.__qualname__}` to the key order to make
-            # it sortable between different types (e.g. `int` vs. `str`)
-            return sorted(
-                items,
-                # pylint: disable-next=consider-using-f-string
-                key=lambda kv: ('{0.__module__}.{0.__qualname__}'.format(kv[0].__class__), kv),
-            )
-        except TypeError:  # cannot sort the keys (e.g. user-defined types)
-            return items  # fallback to insertion order
+        qualname = _TYPE_QUALNAME_CACHE[cls]
+    except KeyError:
+        qualname = _TYPE_QUALNAME_CACHE[cls] = f'{cls.__module__}.{cls.__qualname__}'
+    return qualname, obj
 
 
 def _sorted_keys(dct: dict[KT, VT]) -> Iterable[KT]:  # pragma: no cover
+    if len(dct) <= 1:
+        return list(dct)  # nothing to sort
     try:
         # Sort directly if possible (do not use `key` for performance reasons)
         return sorted(dct)  # type: ignore[type-var]
@@ -302,34 +378,37 @@ def _sorted_keys(dct: dict[KT, VT]) -> Iterable[KT]:  # pragma: no cover
         try:
             # Add `{obj.__class__.__module__}.{obj.__class__.__qualname__}` to the key order to make
             # it sortable between different types (e.g. `int` vs. `str`)
-            return sorted(
-                dct,
-                # pylint: disable-next=consider-using-f-string
-                key=lambda o: ('{0.__module__}.{0.__qualname__}'.format(o.__class__), o),
-            )
+            return sorted(dct, key=_type_qualname_sort_key)
         except TypeError:  # cannot sort the keys (e.g. user-defined types)
             return dct  # fallback to insertion order
 
 
 def _dict_flatten(dct: dict[KT, VT]) -> tuple[tuple[VT, ...], list[KT], tuple[KT, ...]]:
-    keys, values = unzip2(_sorted_items(dct.items()))
-    return values, list(keys), keys
+    # Sort the keys only (rather than the items) and gather the values by key lookups
+    keys = _sorted_keys(dct)
+    if not isinstance(keys, list):
+        keys = list(keys)  # only the insertion-order fallback returns the dict itself
+    values = tuple(map(dct.__getitem__, keys))
+    return values, keys, tuple(keys)
 
 
 def _ordereddict_flatten(
     dct: OrderedDict[KT, VT]
 ) -> tuple[tuple[VT, ...], list[KT], tuple[KT, ...]]:
-    keys, values = unzip2(dct.items())
-    return values, list(keys), keys
+    keys = list(dct)
+    return tuple(dct.values()), keys, tuple(keys)
 
 
 def _defaultdict_flatten(
     dct: defaultdict[KT, VT]
 ) -> tuple[tuple[VT, ...], tuple[Callable[[], VT] | None, list[KT]], tuple[KT, ...]]:
     values, keys, entries = _dict_flatten(dct)
-    return values, (dct.default_factory, list(keys)), entries
+    return values, (dct.default_factory, keys), entries
 
 
+# NOTE: The built-in container types are handled natively by the C++ traversal (`PyTreeKind`) and
+# never re-enter the interpreter while flattening. The entries below are Python-level mirrors of the
+# C++ behaviors, which are only used by `register_pytree_node.get` (e.g., `ops.flatten_one_level`).
 # pylint: disable=all
 _nodetype_registry: dict[type | tuple[str, type], PyTreeNodeRegistryEntry] = {
     type(None): PyTreeNodeRegistryEntry(
@@ -346,15 +425,15 @@ _nodetype_registry: dict[type | tuple[str, type], PyTreeNodeRegistryEntry] = {
     ),
     dict: PyTreeNodeRegistryEntry(
         _dict_flatten,  # type: ignore[arg-type]
-        lambda keys, values: dict(safe_zip(keys, values)),  # type: ignore[arg-type,return-value]
+        lambda keys, values: dict(zip(keys, values)),  # type: ignore[arg-type,return-value]
     ),
     OrderedDict: PyTreeNodeRegistryEntry(
         _ordereddict_flatten,  # type: ignore[arg-type]
-        lambda keys, values: OrderedDict(safe_zip(keys, values)),  # type: ignore[arg-type,return-value]
+        lambda keys, values: OrderedDict(zip(keys, values)),  # type: ignore[arg-type,return-value]
     ),
     defaultdict: PyTreeNodeRegistryEntry(
         _defaultdict_flatten,  # type: ignore[arg-type]
-        lambda metadata, values: defaultdict(metadata[0], safe_zip(metadata[1], values)),  # type: ignore[arg-type,return-value,index]
+        lambda metadata, values: defaultdict(metadata[0], zip(metadata[1], values)),  # type: ignore[arg-type,return-value,index]
     ),
     deque: PyTreeNodeRegistryEntry(
         lambda d: (list(d), d.maxlen),  # type: ignore[call-overload,attr-defined]
@@ -364,11 +443,13 @@ _nodetype_registry: dict[type | tuple[str, type], PyTreeNodeRegistryEntry] = {
 # pylint: enable=all
 
 
-def _pytree_node_registry_get(
-    type: type, *, namespace: str = __GLOBAL_NAMESPACE
-) -> PyTreeNodeRegistryEntry | None:
+def _pytree_node_registry_get(type: type, *, namespace: str = '') -> PyTreeNodeRegistryEntry | None:
+    # Global entries are keyed by the bare type and take precedence over namespaced ones (the same
+    # lookup order as the C++ registry), so the global case is always a single `dict.get`. The
+    # `(namespace, type)` key is only built for namespaces that have registered entries (which never
+    # include the empty string or the global namespace sentinel).
     entry: PyTreeNodeRegistryEntry | None = _nodetype_registry.get(type)
-    if entry is not None or namespace is __GLOBAL_NAMESPACE or namespace == '':
+    if entry is not None or namespace not in __REGISTERED_NAMESPACES:
         return entry
     return _nodetype_registry.get((namespace, type))
 
@@ -380,6 +461,8 @@ del _pytree_node_registry_get
 class _HashablePartialShim:
     """Object that delegates :meth:`__call__`, :meth:`__hash__`, and :meth:`__eq__` to another object."""
 
+    __slots__ = ('partial_func', 'func', 'args', 'keywords')
+
     func: Callable[..., Any]
     args: tuple[Any, ...]
     keywords: dict[str, Any]
@@ -488,35 +571,55 @@ class KeyPathEntry(NamedTuple):
         if isinstance(other, KeyPathEntry):
             return KeyPath((self, other))
         if isinstance(other, KeyPath):
-            return KeyPath((self,) + other.keys)
+            return KeyPath((self, *other))
         return NotImplemented
 
     def __eq__(self, other: object) -> bool:
-        return isinstance(other, self.__class__) and self.key == other.key
+        # Compare the exact entry types by identity rather than `isinstance` (symmetric and cheaper)
+        return type(self) is type(other) and self.key == other.key
+
+    def __ne__(self, other: object) -> bool:
+        return not self.__eq__(other)
 
     def pprint(self) -> str:
         """Pretty name of the key path entry."""
         raise NotImplementedError
 
 
-class KeyPath(NamedTuple):
-    keys: tuple[KeyPathEntry, ...] = ()
+class KeyPath(tuple):  # a flat tuple of key path entries
+    __slots__ = ()
+
+    def __new__(cls, keys: Iterable[KeyPathEntry] = ()) -> KeyPath:
+        return super().__new__(cls, keys)
+
+    @property
+    def keys(self) -> tuple[KeyPathEntry, ...]:
+        """The key path entries as a plain tuple."""
+        return tuple(self)
 
     def __add__(self, other: object) -> KeyPath:
         if isinstance(other, KeyPathEntry):
-            return KeyPath(self.keys + (other,))
+            return KeyPath((*self, other))
         if isinstance(other, KeyPath):
-            return KeyPath(self.keys + other.keys)
+            return KeyPath((*self, *other))
         return NotImplemented
 
     def __eq__(self, other: object) -> bool:
-        return isinstance(other, KeyPath) and self.keys == other.keys
+        return isinstance(other, KeyPath) and tuple.__eq__(self, other)
+
+    def __ne__(self, other: object) -> bool:
+        return not self.__eq__(other)
+
+    __hash__ = tuple.__hash__
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(keys={tuple.__repr__(self)})'
 
     def pprint(self) -> str:
         """Pretty name of the key path."""
-        if not self.keys:
+        if not self:
             return ' tree root'
-        return ''.join(k.pprint() for k in self.keys)
+        return ''.join([k.pprint() for k in self])
 
 
 class GetitemKeyPathEntry(KeyPathEntry):
@@ -556,11 +659,23 @@ def register_keypaths(
     return handler
 
 
-register_keypaths(tuple, lambda tup: list(map(GetitemKeyPathEntry, range(len(tup)))))  # type: ignore[arg-type]
-register_keypaths(list, lambda lst: list(map(GetitemKeyPathEntry, range(len(lst)))))  # type: ignore[arg-type]
+# Pre-built index entries shared by the sequence key path handlers (the entries are immutable)
+_INDEX_KEYPATH_ENTRIES: list[KeyPathEntry] = list(map(GetitemKeyPathEntry, range(256)))
+
+
+def _sequence_keypaths(seq: Sequence[Any]) -> list[KeyPathEntry]:
+    num_children = len(seq)
+    num_cached = len(_INDEX_KEYPATH_ENTRIES)
+    if num_children <= num_cached:
+        return _INDEX_KEYPATH_ENTRIES[:num_children]
+    return _INDEX_KEYPATH_ENTRIES + list(map(GetitemKeyPathEntry, range(num_cached, num_children)))
+
+
+register_keypaths(tuple, _sequence_keypaths)  # type: ignore[arg-type]
+register_keypaths(list, _sequence_keypaths)  # type: ignore[arg-type]
 register_keypaths(dict, lambda dct: list(map(GetitemKeyPathEntry, _sorted_keys(dct))))  # type: ignore[arg-type]
 register_keypaths(OrderedDict, lambda odct: list(map(GetitemKeyPathEntry, odct)))  # type: ignore[arg-type,call-overload]
 register_keypaths(defaultdict, lambda ddct: list(map(GetitemKeyPathEntry, _sorted_keys(ddct))))  # type: ignore[arg-type]
-register_keypaths(deque, lambda dq: list(map(GetitemKeyPathEntry, range(len(dq)))))  # type: ignore[arg-type]
+register_keypaths(deque, _sequence_keypaths)  # type: ignore[arg-type]
 
 register_keypaths.get = _keypath_registry.get  # type: ignore[attr-defined]
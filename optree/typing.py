@@ -18,6 +18,7 @@
 
 from __future__ import annotations
 
+import functools
 from typing import (
     Any,
     Callable,
@@ -40,6 +41,7 @@ from typing_extensions import Protocol  # Python 3.8+
 from typing_extensions import TypeAlias  # Python 3.10+
 
 import optree._C as _C
+from optree._C import is_namedtuple_class, is_structseq_class, structseq_fields
 
 
 try:
@@ -119,9 +121,8 @@ _GenericAlias = type(Union[int, str])
 
 
 def _tp_cache(func):
-    import functools  # pylint: disable=import-outside-toplevel
-
-    cached = functools.lru_cache()(func)
+    # Unbounded cache (same as `functools.cache` in Python 3.9+) without the LRU bookkeeping
+    cached = functools.lru_cache(maxsize=None)(func)
 
     @functools.wraps(func)
     def inner(*args, **kwds):
@@ -134,6 +135,31 @@ def _tp_cache(func):
     return inner
 
 
+def _is_pytree_alias(alias: Any) -> bool:
+    """Return whether the generic alias is a ``Union`` type created by :class:`PyTree`."""
+    return getattr(alias, '__origin__', None) is Union and hasattr(alias, '__pytree_args__')
+
+
+# Interned forward references, so that repeated type names share a single `ForwardRef` object
+_FORWARDREF_INTERN: dict[str, ForwardRef] = {}
+
+
+def _make_ref(arg: str) -> ForwardRef:
+    """Return the interned :class:`ForwardRef` for the given type name."""
+    try:
+        return _FORWARDREF_INTERN[arg]
+    except KeyError:
+        return _FORWARDREF_INTERN.setdefault(arg, ForwardRef(arg))
+
+
+_PYTREE_NAME = 'PyTree'  # `cls.__name__` in `PyTree.__class_getitem__` (subclassing is prohibited)
+
+# Precomputed forward references for the type variables declared in this module
+_TYPEVAR_REFS: dict[TypeVar, ForwardRef] = {
+    tv: _make_ref(f'{_PYTREE_NAME}[{tv.__name__}]') for tv in (T, S, U, KT, VT)
+}
+
+
 class PyTree(Generic[T]):  # pylint: disable=too-few-public-methods
     """Generic PyTree type.
 
@@ -149,6 +175,8 @@ class PyTree(Generic[T]):  # pylint: disable=too-few-public-methods
                  optree.typing.CustomTreeNode[ForwardRef('PyTree[torch.Tensor]')]]
     """
 
+    __slots__ = ()
+
     @_tp_cache
     def __class_getitem__(cls, item: T | tuple[T] | tuple[T, str | None]) -> TypeAlias:
         """Instantiate a PyTree type with the given type."""
@@ -156,27 +184,26 @@ class PyTree(Generic[T]):  # pylint: disable=too-few-public-methods
             item = (item, None)
         if len(item) != 2:
             raise TypeError(
-                f'{cls.__name__}[...] only supports a tuple of 2 items, '
+                f'{_PYTREE_NAME}[...] only supports a tuple of 2 items, '
                 f'a parameter and a string of type name. Got {item!r}.'
             )
         param, name = item
         if name is not None and not isinstance(name, str):
             raise TypeError(
-                f'{cls.__name__}[...] only supports a tuple of 2 items, '
+                f'{_PYTREE_NAME}[...] only supports a tuple of 2 items, '
                 f'a parameter and a string of type name. Got {item!r}.'
             )
 
-        if (
-            isinstance(param, _GenericAlias)
-            and param.__origin__ is Union  # type: ignore[attr-defined]
-            and hasattr(param, '__pytree_args__')
-        ):
+        if isinstance(param, _GenericAlias) and _is_pytree_alias(param):
             return param  # PyTree[PyTree[T]] -> PyTree[T]
 
         if name is not None:
-            recurse_ref = ForwardRef(name)
+            recurse_ref = _make_ref(name)
         elif isinstance(param, TypeVar):
-            recurse_ref = ForwardRef(f'{cls.__name__}[{param.__name__}]')
+            try:
+                recurse_ref = _TYPEVAR_REFS[param]
+            except KeyError:
+                recurse_ref = _make_ref(f'{_PYTREE_NAME}[{param.__name__}]')
         elif isinstance(param, type):
             if param.__module__ == 'builtins':
                 typename = param.__qualname__
@@ -185,9 +212,9 @@ class PyTree(Generic[T]):  # pylint: disable=too-few-public-methods
                     typename = f'{param.__module__}.{param.__qualname__}'
                 except AttributeError:
                     typename = f'{param.__module__}.{param.__name__}'
-            recurse_ref = ForwardRef(f'{cls.__name__}[{typename}]')
+            recurse_ref = _make_ref(f'{_PYTREE_NAME}[{typename}]')
         else:
-            recurse_ref = ForwardRef(f'{cls.__name__}[{param!r}]')
+            recurse_ref = _make_ref(f'{_PYTREE_NAME}[{param!r}]')
 
         pytree_alias = Union[
             param,  # type: ignore[valid-type]
@@ -228,6 +255,8 @@ class PyTreeTypeVar:
                  optree.typing.CustomTreeNode[ForwardRef('TensorTree')]]
     """
 
+    __slots__ = ()
+
     @_tp_cache
     def __new__(cls, name: str, param: type) -> TypeAlias:
         """Instantiate a PyTree type variable with the given name and parameter."""
@@ -258,43 +287,7 @@ def is_namedtuple(obj: object | type) -> bool:
     return is_namedtuple_class(cls)
 
 
-def is_namedtuple_class(cls: type) -> bool:
-    """Return whether the class is a subclass of namedtuple."""
-    return (
-        isinstance(cls, type)
-        and issubclass(cls, tuple)
-        and isinstance(getattr(cls, '_fields', None), tuple)
-        and all(isinstance(field, str) for field in cls._fields)  # type: ignore[attr-defined]
-    )
-
-
 def is_structseq(obj: object | type) -> bool:
     """Return whether the object is an instance of PyStructSequence or a class of PyStructSequence."""
     cls = obj if isinstance(obj, type) else type(obj)
     return is_structseq_class(cls)
-
-
-def is_structseq_class(cls: type) -> bool:
-    """Return whether the class is a class of PyStructSequence."""
-    if (
-        isinstance(cls, type)
-        # Check direct inheritance from `tuple` rather than `issubclass(cls, tuple)`
-        and cls.__base__ is tuple
-        and isinstance(getattr(cls, 'n_sequence_fields', None), int)
-        and isinstance(getattr(cls, 'n_fields', None), int)
-        and isinstance(getattr(cls, 'n_unnamed_fields', None), int)
-    ):
-        try:
-            # pylint: disable-next=missing-class-docstring,too-few-public-methods,unused-variable
-            class SubClass(cls):  # type: ignore[misc,valid-type]
-                pass
-
-        except TypeError:
-            return True
-
-    return False
-
-
-# Ensure that the behavior is consistent with C++ implementation
-# pylint: disable-next=wrong-import-position
-from optree._C import is_namedtuple_class, is_structseq_class, structseq_fields
@@ -47,6 +47,13 @@ void BuildModule(py::module& mod) {  // NOLINT[runtime/references]
              py::arg("leaf_predicate") = std::nullopt,
              py::arg("none_is_leaf") = false,
              py::arg("namespace") = "")
+        .def("flatten_leaves",
+             &PyTreeSpec::FlattenLeaves,
+             "Flattens a pytree into a list of leaves without building the treespec.",
+             py::arg("tree"),
+             py::arg("leaf_predicate") = std::nullopt,
+             py::arg("none_is_leaf") = false,
+             py::arg("namespace") = "")
         .def("flatten_with_path",
              &PyTreeSpec::FlattenWithPath,
              "Flatten a pytree and additionally record the paths.",
@@ -654,4 +654,134 @@ template <bool NoneIsLeaf>
     }
 }
 
+template <bool NoneIsLeaf>
+// NOLINTNEXTLINE[readability-function-cognitive-complexity]
+/*static*/ void PyTreeSpec::FlattenLeavesImpl(const py::handle& handle,
+                                              std::vector<py::object>& leaves,
+                                              const ssize_t& depth,
+                                              const std::optional<py::function>& leaf_predicate,
+                                              const std::string& registry_namespace) {
+    if (depth > MAX_RECURSION_DEPTH) [[unlikely]] {
+        PyErr_SetString(PyExc_RecursionError,
+                        "maximum recursion depth exceeded during flattening the tree");
+        throw py::error_already_set();
+    }
+
+    if (leaf_predicate && (*leaf_predicate)(handle).cast<bool>()) [[unlikely]] {
+        leaves.emplace_back(py::reinterpret_borrow<py::object>(handle));
+        return;
+    }
+
+    const PyTreeTypeRegistry::Registration* custom = nullptr;
+    PyTreeKind kind = GetKind<NoneIsLeaf>(handle, &custom, registry_namespace);
+    // NOLINTNEXTLINE[misc-no-recursion]
+    auto recurse = [&leaf_predicate, &registry_namespace, &leaves, &depth](py::handle child) {
+        FlattenLeavesImpl<NoneIsLeaf>(child, leaves, depth + 1, leaf_predicate, registry_namespace);
+    };
+    switch (kind) {
+        case PyTreeKind::None:
+            if (!NoneIsLeaf) {
+                break;
+            }
+            [[fallthrough]];
+        case PyTreeKind::Leaf:
+            leaves.emplace_back(py::reinterpret_borrow<py::object>(handle));
+            break;
+
+        case PyTreeKind::Tuple:
+        case PyTreeKind::NamedTuple:
+        case PyTreeKind::StructSequence: {
+            const ssize_t arity = GET_SIZE<py::tuple>(handle);
+            for (ssize_t i = 0; i < arity; ++i) {
+                recurse(GET_ITEM_HANDLE<py::tuple>(handle, i));
+            }
+            break;
+        }
+
+        case PyTreeKind::List: {
+            const ssize_t arity = GET_SIZE<py::list>(handle);
+            for (ssize_t i = 0; i < arity; ++i) {
+                recurse(GET_ITEM_HANDLE<py::list>(handle, i));
+            }
+            break;
+        }
+
+        case PyTreeKind::Dict:
+        case PyTreeKind::OrderedDict:
+        case PyTreeKind::DefaultDict: {
+            auto dict = py::reinterpret_borrow<py::dict>(handle);
+            py::list keys;
+            if (kind == PyTreeKind::OrderedDict) [[unlikely]] {
+                keys = DictKeys(dict);
+            } else [[likely]] {
+                keys = SortedDictKeys(dict);
+            }
+            for (const py::handle& key : keys) {
+                recurse(dict[key]);
+            }
+            break;
+        }
+
+        case PyTreeKind::Deque: {
+            auto list = handle.cast<py::list>();
+            const ssize_t arity = GET_SIZE<py::list>(list);
+            for (ssize_t i = 0; i < arity; ++i) {
+                recurse(GET_ITEM_HANDLE<py::list>(list, i));
+            }
+            break;
+        }
+
+        case PyTreeKind::Custom: {
+            py::tuple out = py::cast<py::tuple>(custom->to_iterable(handle));
+            const ssize_t num_out = GET_SIZE<py::tuple>(out);
+            if (num_out != 2 && num_out != 3) [[unlikely]] {
+                throw std::runtime_error(absl::StrFormat(
+                    "PyTree custom flatten function for type %s should return a 2- or 3-tuple, "
+                    "got %ld.",
+                    py::repr(custom->type),
+                    num_out));
+            }
+            ssize_t arity = 0;
+            for (const py::handle& child :
+                 py::cast<py::iterable>(GET_ITEM_BORROW<py::tuple>(out, 0))) {
+                ++arity;
+                recurse(child);
+            }
+            if (num_out == 3) [[likely]] {
+                py::object node_entries = GET_ITEM_BORROW<py::tuple>(out, 2);
+                if (!node_entries.is_none()) [[likely]] {
+                    const ssize_t num_entries =
+                        GET_SIZE<py::tuple>(py::cast<py::tuple>(std::move(node_entries)));
+                    if (num_entries != arity) [[unlikely]] {
+                        throw std::runtime_error(absl::StrFormat(
+                            "PyTree custom flatten function for type %s returned inconsistent "
+                            "number of children (%ld) and number of entries (%ld).",
+                            py::repr(custom->type),
+                            arity,
+                            num_entries));
+                    }
+                }
+            }
+            break;
+        }
+
+        default:
+            INTERNAL_ERROR();
+    }
+}
+
+/*static*/ std::vector<py::object> PyTreeSpec::FlattenLeaves(
+    const py::handle& tree,
+    const std::optional<py::function>& leaf_predicate,
+    const bool& none_is_leaf,
+    const std::string& registry_namespace) {
+    std::vector<py::object> leaves;
+    if (none_is_leaf) [[unlikely]] {
+        FlattenLeavesImpl<NONE_IS_LEAF>(tree, leaves, 0, leaf_predicate, registry_namespace);
+    } else [[likely]] {
+        FlattenLeavesImpl<NONE_IS_NODE>(tree, leaves, 0, leaf_predicate, registry_namespace);
+    }
+    return leaves;
+}
+
 }  // namespace optree
@@ -71,6 +71,7 @@ def test_max_depth():
         l = [l]
     optree.tree_flatten(l)
     optree.tree_flatten_with_path(l)
+    optree.tree_leaves(l)
 
     l = [l]
     with pytest.raises(
@@ -81,6 +82,37 @@ def test_max_depth():
         RecursionError, match='maximum recursion depth exceeded during flattening the tree'
     ):
         optree.tree_flatten_with_path(l)
+    with pytest.raises(
+        RecursionError, match='maximum recursion depth exceeded during flattening the tree'
+    ):
+        optree.tree_leaves(l)
+
+
+@parametrize(
+    tree=list(TREES + LEAVES),
+    is_leaf=[
+        None,
+        lambda x: False,
+        lambda x: isinstance(x, tuple),
+        lambda x: isinstance(x, list) and len(x) > 1,
+    ],
+    none_is_leaf=[False, True],
+    namespace=['', 'undefined', 'namespace'],
+)
+def test_leaves_consistent_with_flatten(tree, is_leaf, none_is_leaf, namespace):
+    leaves = optree.tree_leaves(
+        tree,
+        is_leaf,
+        none_is_leaf=none_is_leaf,
+        namespace=namespace,
+    )
+    expected_leaves, _ = optree.tree_flatten(
+        tree,
+        is_leaf,
+        none_is_leaf=none_is_leaf,
+        namespace=namespace,
+    )
+    assert leaves == expected_leaves
 
 
 @parametrize(
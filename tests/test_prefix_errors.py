@@ -200,6 +200,27 @@ def test_key_path():
     ):
         1 + root
 
+    assert sequence_key_path == GetitemKeyPathEntry(0)
+    assert sequence_key_path != FlattenedKeyPathEntry(0)
+    assert namedtuple_key_path != GetitemKeyPathEntry('attr')
+    assert sequence_key_path != (0,)
+    assert hash(sequence_key_path) == hash(GetitemKeyPathEntry(0))
+    assert len({sequence_key_path, GetitemKeyPathEntry(0), FlattenedKeyPathEntry(0)}) == 2
+
+    assert root.keys == ()
+    assert (root + sequence_key_path).keys == (sequence_key_path,)
+    assert root + sequence_key_path != (sequence_key_path,)
+
+    key_path = root + sequence_key_path + dict_key_path + namedtuple_key_path
+    assert not root
+    assert key_path
+    assert len(root) == 0
+    assert len(key_path) == 3
+    assert list(key_path) == [sequence_key_path, dict_key_path, namedtuple_key_path]
+    assert key_path[0] == sequence_key_path
+    assert key_path[-1] == namedtuple_key_path
+    assert isinstance(key_path, tuple)
+
     assert root.pprint() == ' tree root'
     assert root + root == root
     assert root + sequence_key_path == KeyPath((sequence_key_path,))
@@ -243,3 +264,36 @@ def test_key_path():
         (Vector2D(1, 2), [FlattenedKeyPathEntry(0), FlattenedKeyPathEntry(1)]),
     ):
         assert optree.ops._child_keys(node) == key_paths
+
+
+def test_key_path_handler_lookup_is_exact_type():
+    @optree.register_pytree_node_class(namespace='keypath')
+    class Pair:
+        def __init__(self, x, y):
+            self.x = x
+            self.y = y
+
+        def tree_flatten(self):
+            return (self.x, self.y), None
+
+        @classmethod
+        def tree_unflatten(cls, metadata, children):
+            return cls(*children)
+
+    @optree.register_pytree_node_class(namespace='keypath')
+    class SubPair(Pair):
+        pass
+
+    optree.register_keypaths(
+        Pair, lambda p: [AttributeKeyPathEntry('x'), AttributeKeyPathEntry('y')]
+    )
+
+    assert optree.ops._child_keys(Pair(1, 2), namespace='keypath') == [
+        AttributeKeyPathEntry('x'),
+        AttributeKeyPathEntry('y'),
+    ]
+    # Subclasses do not inherit the key path handler of the base class
+    assert optree.ops._child_keys(SubPair(1, 2), namespace='keypath') == [
+        FlattenedKeyPathEntry(0),
+        FlattenedKeyPathEntry(1),
+    ]
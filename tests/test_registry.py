@@ -15,8 +15,11 @@
 
 # pylint: disable=missing-function-docstring,invalid-name
 
+import abc
+import functools
+import operator
 import re
-from collections import UserDict, UserList, namedtuple
+from collections import OrderedDict, UserDict, UserList, defaultdict, deque, namedtuple
 
 import pytest
 
@@ -280,6 +283,12 @@ def test_flatten_with_wrong_number_of_returns():
     ):
         optree.ops.flatten_one_level(MyList1([1, 2, 3]), namespace='error')
 
+    with pytest.raises(
+        RuntimeError,
+        match=r"PyTree custom flatten function for type <class '.*'> should return a 2- or 3-tuple, got 1\.",
+    ):
+        optree.tree_leaves(MyList1([1, 2, 3]), namespace='error')
+
     @optree.register_pytree_node_class(namespace='error')
     class MyList4(UserList):
         def tree_flatten(self):
@@ -301,6 +310,12 @@ def test_flatten_with_wrong_number_of_returns():
     ):
         optree.ops.flatten_one_level(MyList4([1, 2, 3]), namespace='error')
 
+    with pytest.raises(
+        RuntimeError,
+        match=r"PyTree custom flatten function for type <class '.*'> should return a 2- or 3-tuple, got 4\.",
+    ):
+        optree.tree_leaves(MyList4([1, 2, 3]), namespace='error')
+
     @optree.register_pytree_node_class(namespace='error')
     class MyListEntryMismatch(UserList):
         def tree_flatten(self):
@@ -322,6 +337,12 @@ def test_flatten_with_wrong_number_of_returns():
     ):
         optree.ops.flatten_one_level(MyListEntryMismatch([1, 2, 3]), namespace='error')
 
+    with pytest.raises(
+        RuntimeError,
+        match=r"PyTree custom flatten function for type <class '.*'> returned inconsistent number of children \(3\) and number of entries \(4\)\.",
+    ):
+        optree.tree_leaves(MyListEntryMismatch([1, 2, 3]), namespace='error')
+
 
 def test_pytree_node_registry_get():
     handler = optree.register_pytree_node.get(list)
@@ -398,3 +419,130 @@ def test_pytree_node_registry_with_init_subclass():
         str(treespec)
         == "PyTreeSpec(CustomTreeNode(MyDict[['c', 'b', 'a']], [CustomTreeNode(MyAnotherDict[['f', 'd']], [*, *]), *, (*, *)]), namespace='mydict')"
     )
+
+
+def test_register_pytree_node_class_flatten_func():
+    @optree.register_pytree_node_class(namespace='flatten-func')
+    class PlainMethod(UserList):
+        def tree_flatten(self):
+            return self.data, None, None
+
+        @classmethod
+        def tree_unflatten(cls, metadata, children):
+            return cls(children)
+
+    class PartialMethod(UserList):
+        def _tree_flatten(self, reverse):
+            return self.data[::-1] if reverse else self.data, reverse, None
+
+        tree_flatten = functools.partialmethod(_tree_flatten, reverse=True)
+
+        @classmethod
+        def tree_unflatten(cls, metadata, children):
+            return cls(children[::-1] if metadata else children)
+
+    optree.register_pytree_node_class(PartialMethod, namespace='flatten-func')
+
+    handler = optree.register_pytree_node.get(PlainMethod, namespace='flatten-func')
+    assert handler is not None
+    assert handler.to_iterable is PlainMethod.tree_flatten
+    leaves, treespec = optree.tree_flatten(PlainMethod([1, 2, 3]), namespace='flatten-func')
+    assert leaves == [1, 2, 3]
+    assert optree.tree_unflatten(treespec, leaves) == PlainMethod([1, 2, 3])
+
+    handler = optree.register_pytree_node.get(PartialMethod, namespace='flatten-func')
+    assert handler is not None
+    assert isinstance(handler.to_iterable, operator.methodcaller)
+    leaves, treespec = optree.tree_flatten(PartialMethod([1, 2, 3]), namespace='flatten-func')
+    assert leaves == [3, 2, 1]
+    assert optree.tree_unflatten(treespec, leaves) == PartialMethod([1, 2, 3])
+
+
+def test_pytree_node_registry_get_builtins_consistent_with_flatten():
+    for node in (
+        None,
+        (1, 2, 3),
+        [1, 2, 3],
+        {'b': 1, 'a': 2, 'c': 3},
+        {1: 'a', 'b': 2, (3,): 'c', 4.0: None},
+        OrderedDict([('b', 1), ('a', 2)]),
+        defaultdict(int, {'b': 1, 'a': 2}),
+        deque([1, 2, 3], maxlen=5),
+    ):
+        handler = optree.register_pytree_node.get(type(node))
+        assert handler is not None
+        children, metadata, *_ = handler.to_iterable(node)
+        leaves, treespec = optree.tree_flatten(node, is_leaf=lambda x, root=node: x is not root)
+        assert list(children) == leaves
+        assert handler.from_iterable(metadata, children) == node
+        assert treespec.num_children == len(leaves)
+
+
+def test_register_pytree_nodes():
+    class MyList(UserList):
+        pass
+
+    class MyDict(UserDict):
+        pass
+
+    optree.register_pytree_nodes(
+        [
+            (MyList, lambda l: (l.data, None, None), lambda _, l: MyList(l), 'batch'),
+            (
+                MyDict,
+                lambda d: (list(d.values()), list(d.keys()), list(d.keys())),
+                lambda keys, values: MyDict(zip(keys, values)),
+                'batch',
+            ),
+        ]
+    )
+    assert optree.register_pytree_node.get(MyList) is None
+    assert optree.register_pytree_node.get(MyList, namespace='batch') is not None
+    assert optree.register_pytree_node.get(MyDict, namespace='batch') is not None
+
+    tree = MyDict(a=MyList([1, 2]), b=3)
+    leaves, treespec = optree.tree_flatten(tree, namespace='batch')
+    assert leaves == [1, 2, 3]
+    assert optree.tree_unflatten(treespec, leaves) == tree
+
+    class MyTuple(UserList):
+        pass
+
+    with pytest.raises(TypeError, match='The namespace must be a string'):
+        optree.register_pytree_nodes(
+            [
+                (MyTuple, lambda t: (t.data, None, None), lambda _, t: MyTuple(t), 'batch'),
+                (MyList, lambda l: (l.data, None, None), lambda _, l: MyList(l), 1),
+            ]
+        )
+    # Nothing is registered if any entry is invalid
+    assert optree.register_pytree_node.get(MyTuple, namespace='batch') is None
+
+    with pytest.raises(
+        ValueError, match=r"PyTree type.*is already registered in namespace 'batch'\."
+    ):
+        optree.register_pytree_nodes(
+            [
+                (MyTuple, lambda t: (t.data, None, None), lambda _, t: MyTuple(t), 'batch'),
+                (MyList, lambda l: (l.data, None, None), lambda _, l: MyList(l), 'batch'),
+            ]
+        )
+    # The entries preceding the failed one remain registered
+    assert optree.register_pytree_node.get(MyTuple, namespace='batch') is not None
+    assert optree.tree_leaves(MyTuple([1, 2]), namespace='batch') == [1, 2]
+
+
+def test_register_pytree_node_in_multiple_namespaces_keeps_abc_cache():
+    class MyList(UserList):
+        def tree_flatten(self):
+            return self.data, None, None
+
+        @classmethod
+        def tree_unflatten(cls, metadata, children):
+            return cls(children)
+
+    optree.register_pytree_node_class(MyList, namespace='abc-cache1')
+    cache_token = abc.get_cache_token()
+    optree.register_pytree_node_class(MyList, namespace='abc-cache2')
+    assert abc.get_cache_token() == cache_token
+    assert optree.tree_leaves(MyList([1, 2]), namespace='abc-cache2') == [1, 2]
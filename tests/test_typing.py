@@ -15,6 +15,7 @@
 
 # pylint: disable=missing-function-docstring
 
+import os
 import re
 import sys
 import time
@@ -69,6 +70,7 @@ def test_is_structseq():
     assert not optree.is_structseq([1, 2])
     assert optree.is_structseq(sys.float_info)
     assert optree.is_structseq(time.gmtime())
+    assert optree.is_structseq(os.stat('.'))
     assert not optree.is_structseq(CustomTuple(1, 2))
     assert not optree.is_structseq(CustomNamedTupleSubclass(1, 2))
     assert not optree.is_structseq(FakeNamedTuple((1, 2, 3)))
@@ -85,6 +87,7 @@ def test_is_structseq():
     assert not optree.is_structseq(Vector2D)
     assert optree.is_structseq_class(type(sys.float_info))
     assert optree.is_structseq_class(time.struct_time)
+    assert optree.is_structseq_class(os.stat_result)
     assert not optree.is_structseq_class(CustomTuple)
     assert not optree.is_structseq_class(CustomNamedTupleSubclass)
     assert not optree.is_structseq_class(FakeNamedTuple)